@@ -0,0 +1,204 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Native tree and batch file deletion for quick_cleaner_V2.
+# Build in place with:  cythonize -i _fastclean.pyx
+# The cleaner falls back to its pure-Python path when this isn't built.
+
+import os
+
+from libc.stddef cimport wchar_t
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport malloc, calloc, free
+from libc.string cimport memcpy
+
+cdef extern from "Python.h":
+    wchar_t* PyUnicode_AsWideCharString(object unicode, Py_ssize_t* size) except NULL
+    void PyMem_Free(void* p)
+
+cdef extern from "<wchar.h>" nogil:
+    size_t wcslen(const wchar_t* s)
+
+cdef extern from "<windows.h>" nogil:
+    ctypedef void* HANDLE
+    ctypedef unsigned long DWORD
+    ctypedef int BOOL
+
+    ctypedef struct WIN32_FIND_DATAW:
+        DWORD dwFileAttributes
+        DWORD nFileSizeHigh
+        DWORD nFileSizeLow
+        wchar_t cFileName[260]
+
+    HANDLE INVALID_HANDLE_VALUE
+    DWORD FILE_ATTRIBUTE_READONLY
+    DWORD FILE_ATTRIBUTE_DIRECTORY
+    DWORD FILE_ATTRIBUTE_REPARSE_POINT
+    DWORD ERROR_ACCESS_DENIED
+
+    HANDLE FindFirstFileW(const wchar_t* lpFileName, WIN32_FIND_DATAW* lpFindFileData)
+    BOOL FindNextFileW(HANDLE hFindFile, WIN32_FIND_DATAW* lpFindFileData)
+    BOOL FindClose(HANDLE hFindFile)
+    BOOL DeleteFileW(const wchar_t* lpFileName)
+    BOOL RemoveDirectoryW(const wchar_t* lpPathName)
+    BOOL SetFileAttributesW(const wchar_t* lpFileName, DWORD dwFileAttributes)
+    DWORD GetLastError()
+    long long InterlockedExchangeAdd64(long long* Addend, long long Value)
+
+cdef enum:
+    PATH_CAP = 32768    # longest path Win32 accepts, in wchar_t
+    SEP = 92            # '\\'
+    ALT_SEP = 47        # '/'
+    STAR = 42           # '*'
+    DOT = 46            # '.'
+    PUBLISH_EVERY = 1024    # files between updates of the shared counter
+
+# Bytes freed by every walk in this process, for live progress. Walks keep a
+# local tally and only touch this (atomically) every PUBLISH_EVERY files.
+cdef long long _published = 0
+
+ctypedef struct Tally:
+    uint64_t pending
+    unsigned int files
+
+cdef inline void _publish(Tally* t) noexcept nogil:
+    if t.pending:
+        InterlockedExchangeAdd64(&_published, <long long>t.pending)
+        t.pending = 0
+    t.files = 0
+
+cdef inline bint _is_dot_entry(const wchar_t* name) noexcept nogil:
+    return name[0] == DOT and (name[1] == 0 or (name[1] == DOT and name[2] == 0))
+
+cdef bint _delete_file(const wchar_t* path, DWORD attrs) noexcept nogil:
+    if DeleteFileW(path):
+        return True
+    # Only read-only files need their attributes touched, and only on failure
+    if GetLastError() == ERROR_ACCESS_DENIED and attrs & FILE_ATTRIBUTE_READONLY:
+        if SetFileAttributesW(path, attrs & ~FILE_ATTRIBUTE_READONLY):
+            return DeleteFileW(path) != 0
+    return False
+
+cdef uint64_t _wipe(wchar_t* buf, size_t n, Tally* t) noexcept nogil:
+    # buf[:n] names a directory; delete everything under it, then the
+    # directory itself. buf has room for PATH_CAP characters and is reused
+    # for every child path, so the walk allocates nothing.
+    cdef WIN32_FIND_DATAW fd
+    cdef HANDLE h
+    cdef size_t m
+    cdef DWORD attrs
+    cdef uint64_t size
+    cdef uint64_t freed = 0
+
+    if n + 3 > PATH_CAP:
+        return 0
+    buf[n] = SEP
+    buf[n + 1] = STAR
+    buf[n + 2] = 0
+    h = FindFirstFileW(buf, &fd)
+    if h != INVALID_HANDLE_VALUE:
+        while True:
+            if not _is_dot_entry(fd.cFileName):
+                m = wcslen(fd.cFileName)
+                attrs = fd.dwFileAttributes
+                # Reparse points (symlinks, junctions) are never followed or removed
+                if n + 1 + m < PATH_CAP and not attrs & FILE_ATTRIBUTE_REPARSE_POINT:
+                    memcpy(&buf[n + 1], fd.cFileName, (m + 1) * sizeof(wchar_t))
+                    if attrs & FILE_ATTRIBUTE_DIRECTORY:
+                        freed += _wipe(buf, n + 1 + m, t)
+                    elif _delete_file(buf, attrs):
+                        size = (<uint64_t>fd.nFileSizeHigh << 32) | fd.nFileSizeLow
+                        freed += size
+                        t.pending += size
+                        t.files += 1
+                        if t.files >= PUBLISH_EVERY:
+                            _publish(t)
+            if not FindNextFileW(h, &fd):
+                break
+        FindClose(h)
+    buf[n] = 0
+    RemoveDirectoryW(buf)
+    return freed
+
+cdef uint64_t wipe_tree_native(const wchar_t* path) noexcept nogil:
+    # C entry point: delete the tree at path and return bytes freed.
+    cdef size_t n = wcslen(path)
+    cdef wchar_t* buf
+    cdef uint64_t freed
+    cdef Tally t
+    t.pending = 0
+    t.files = 0
+    while n > 0 and (path[n - 1] == SEP or path[n - 1] == ALT_SEP):
+        n -= 1
+    if n == 0 or n + 3 > PATH_CAP:
+        return 0
+    buf = <wchar_t*>malloc(PATH_CAP * sizeof(wchar_t))
+    if buf == NULL:
+        return 0
+    memcpy(buf, path, n * sizeof(wchar_t))
+    buf[n] = 0
+    freed = _wipe(buf, n, &t)
+    _publish(&t)
+    free(buf)
+    return freed
+
+def wipe_tree_c(path):
+    """Delete the directory tree at path, skipping reparse points.
+
+    Returns the number of bytes freed. The cleaner submits each top-level
+    subtree as its own call on the pool for the tree's disk, and the GIL is
+    released for the whole walk, so those calls run side by side.
+    """
+    cdef wchar_t* wpath = PyUnicode_AsWideCharString(os.fspath(path), NULL)
+    cdef uint64_t freed
+    try:
+        with nogil:
+            freed = wipe_tree_native(wpath)
+    finally:
+        PyMem_Free(wpath)
+    return freed
+
+def freed_total_c():
+    """Bytes freed by all wipe_tree_c calls so far, including running ones.
+
+    delete_batch_c is not counted here; its callers publish its result.
+    """
+    return InterlockedExchangeAdd64(&_published, 0)
+
+def delete_batch_c(items):
+    """Delete (path, size, attrs) files and return the bytes freed.
+
+    Used for the loose files at the top of a cleaned directory, which the
+    cleaner batches onto the per-disk deletion pool. The deletes run without
+    the GIL. Reparse points are skipped.
+    """
+    cdef Py_ssize_t n = len(items)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k = 0
+    cdef wchar_t** paths
+    cdef uint64_t* sizes
+    cdef DWORD* attrs
+    cdef uint64_t freed = 0
+    if n == 0:
+        return 0
+    paths = <wchar_t**>calloc(n, sizeof(wchar_t*))
+    sizes = <uint64_t*>calloc(n, sizeof(uint64_t))
+    attrs = <DWORD*>calloc(n, sizeof(DWORD))
+    try:
+        if paths == NULL or sizes == NULL or attrs == NULL:
+            raise MemoryError()
+        for path, size, attr in items:
+            paths[k] = PyUnicode_AsWideCharString(os.fspath(path), NULL)
+            sizes[k] = size
+            attrs[k] = attr
+            k += 1
+        with nogil:
+            for i in range(k):
+                if not attrs[i] & FILE_ATTRIBUTE_REPARSE_POINT and _delete_file(paths[i], attrs[i]):
+                    freed += sizes[i]
+    finally:
+        if paths != NULL:
+            for i in range(k):
+                PyMem_Free(paths[i])
+        free(paths)
+        free(sizes)
+        free(attrs)
+    return freed
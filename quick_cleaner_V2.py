@@ -1,13 +1,21 @@
 import os
 import sys
-import gc
 import stat
+import re
 import fnmatch
+import functools
+import time
+import uuid
+import threading
 import ctypes
 from ctypes import wintypes
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QThread, Signal, QPoint
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, QElapsedTimer, Signal, QPoint
+)
 from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap, QAction
 from PySide6.QtWidgets import (
     QApplication, QWidget, QFrame, QLabel, QVBoxLayout, QHBoxLayout, QToolButton,
@@ -15,14 +23,15 @@ from PySide6.QtWidgets import (
 )
 
 # ---------------------- Utilities ----------------------
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 def human_size(n: int) -> str:
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    f = float(max(0, n))
-    while f >= 1024.0 and i < len(units) - 1:
-        f /= 1024.0
-        i += 1
-    return f"{int(f)} {units[i]}" if i == 0 else f"{f:.1f} {units[i]}"
+    # Unit index straight from the bit length: each unit is 10 more bits
+    n = max(0, int(n))
+    i = min(len(SIZE_UNITS) - 1, max(0, (n.bit_length() - 1) // 10))
+    if i == 0:
+        return f"{n} B"
+    return f"{n / (1 << (10 * i)):.1f} {SIZE_UNITS[i]}"
 
 def ensure_path(p):
     try:
@@ -30,83 +39,507 @@ def ensure_path(p):
     except Exception:
         return Path(p)
 
-def safe_remove_file(p: Path) -> int:
+kernel32 = ctypes.windll.kernel32
+
+SetFileAttributesW = kernel32.SetFileAttributesW
+SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+SetFileAttributesW.restype = wintypes.BOOL
+
+ERROR_ACCESS_DENIED = 5
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+def safe_remove_file(path: str, size: int, attrs: int) -> int:
+    # Unlink straight away and report the size the caller already has.
+    # Only ERROR_ACCESS_DENIED gets the read-only clear and one retry; a file
+    # that is already gone, or any other error, just frees nothing.
     try:
-        if not p.exists() or p.is_symlink():
-            return 0
-        size = 0
-        try:
-            size = p.stat().st_size
-        except Exception:
-            pass
-        try:
-            os.chmod(p, stat.S_IWRITE | stat.S_IREAD)
-        except Exception:
-            pass
-        p.unlink(missing_ok=True)
+        os.unlink(path)
         return int(size)
-    except Exception:
+    except OSError as e:
+        if getattr(e, "winerror", None) != ERROR_ACCESS_DENIED:
+            return 0
+    if not attrs & stat.FILE_ATTRIBUTE_READONLY:
+        return 0
+    if not SetFileAttributesW(path, attrs & ~stat.FILE_ATTRIBUTE_READONLY):
+        return 0
+    try:
+        os.unlink(path)
+    except OSError:
         return 0
+    return int(size)
 
-def wipe_tree(path: Path) -> int:
-    # Delete dir tree, ignore errors and symlinks. Return bytes freed.
-    freed = 0
+def _safe_remove_entry(entry) -> int:
+    # Type, size and attributes come from the DirEntry, which on Windows
+    # already carries them from the directory listing.
     try:
-        if not path.exists() or path.is_symlink():
+        if entry.is_symlink():
             return 0
-        for root, dirs, files in os.walk(path, topdown=False):
-            root_p = Path(root)
-            for name in files:
-                freed += safe_remove_file(root_p / name)
-            for name in dirs:
-                dp = root_p / name
-                try:
-                    dp.rmdir()
-                except Exception:
-                    pass
+        st = entry.stat(follow_symlinks=False)
+    except OSError:
+        return 0
+    return safe_remove_file(entry.path, st.st_size, st.st_file_attributes)
+
+# Leaf-file deletions are latency-bound syscalls, so many of them in flight
+# keep the disk queue busy. Only leaf work goes to a deletion pool: nothing
+# submitted ever waits on a pool, so none can deadlock. Trees get the pool
+# of their physical disk (see _pool_for); this one is the fallback.
+_DEL_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Running total of bytes freed by any deletion thread, published per batch
+# rather than per file. The UI polls freed_so_far() for live progress.
+_freed_lock = threading.Lock()
+_freed_live = 0
+
+def _publish_freed(n: int) -> int:
+    global _freed_live
+    if n:
+        with _freed_lock:
+            _freed_live += n
+    return n
+
+def freed_so_far() -> int:
+    total = _freed_live
+    if freed_total_c is not None:
+        total += int(freed_total_c())
+    return total
+
+def _sum_results(futures) -> int:
+    freed = 0
+    for f in futures:
         try:
-            path.rmdir()
+            freed += int(f.result() or 0)
         except Exception:
             pass
-    except Exception:
-        pass
     return freed
 
-def wipe_dir_contents(path: Path) -> int:
-    # Delete contents of a directory (not the directory itself).
-    freed = 0
-    if not path.exists() or not path.is_dir():
+def _queue_file(pool, entry, batch, futures):
+    # Hand files to the pool in chunks so each worker runs one shell batch.
+    batch.append(entry)
+    if len(batch) >= BULK_DELETE_CHUNK:
+        futures.append(pool.submit(_bulk_delete, batch[:]))
+        batch.clear()
+
+def _flush_batch(pool, batch, futures):
+    if batch:
+        futures.append(pool.submit(_bulk_delete, batch[:]))
+        batch.clear()
+
+# Optional native walker and batch deleter (see _fastclean.pyx); a Python
+# walk with shell batches otherwise
+try:
+    from _fastclean import wipe_tree_c, delete_batch_c, freed_total_c
+except ImportError:
+    wipe_tree_c = delete_batch_c = freed_total_c = None
+
+def _is_reparse(entry) -> bool:
+    # Symlinks and junctions alike; is_dir(follow_symlinks=False) is still
+    # True for a junction, so walking on that alone would empty its target.
+    return bool(entry.stat(follow_symlinks=False).st_file_attributes
+                & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def wipe_tree(path, pool=None) -> int:
+    # Delete dir tree, ignore errors and reparse points. Return bytes freed.
+    path = os.fspath(path)
+    try:
+        st = os.lstat(path)
+    except OSError:
         return 0
+    if st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT or not stat.S_ISDIR(st.st_mode):
+        return 0
+    pool = pool or _pool_for(path)
+    if wipe_tree_c is not None:
+        # One native walk as a leaf task on the disk's pool
+        return _sum_results([pool.submit(wipe_tree_c, path)])
+    batch = []
+    futures = []
+    # Iterative scandir walk; dirs_post is in discovery order, so every
+    # directory comes after its parent and reversing it yields children first
+    stack = [path]
+    dirs_post = [path]
+    # Enumeration seeks too, so walks on one disk share its slots
+    with _walk_slots[pool]:
+        while stack:
+            d = stack.pop()
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        try:
+                            if _is_reparse(entry):
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                dirs_post.append(entry.path)
+                                continue
+                        except OSError:
+                            continue
+                        _queue_file(pool, entry, batch, futures)
+            except OSError:
+                pass
+    _flush_batch(pool, batch, futures)
+    # Directories can only go once their files are gone
+    freed = _sum_results(futures)
+    for d in reversed(dirs_post):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+    return freed
+
+def wipe_dir_contents(path, pool=None) -> int:
+    # Delete contents of a directory (not the directory itself). Callers
+    # cleaning many dirs under one root pass that root's pool.
+    freed = 0
+    batch = []
+    futures = []
     try:
         with os.scandir(path) as it:
+            # Only look the disk up once the directory is known to exist
+            pool = pool or _pool_for(path)
             for entry in it:
-                p = Path(entry.path)
-                if p.is_dir() and not p.is_symlink():
-                    freed += wipe_tree(p)
-                elif p.is_file():
-                    freed += safe_remove_file(p)
-    except Exception:
+                try:
+                    if _is_reparse(entry):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if wipe_tree_c is not None:
+                            # Each subtree is one native walk on the disk's pool
+                            futures.append(pool.submit(wipe_tree_c, entry.path))
+                        else:
+                            freed += wipe_tree(entry.path, pool)
+                    elif entry.is_file(follow_symlinks=False):
+                        _queue_file(pool, entry, batch, futures)
+                except OSError:
+                    pass
+    except OSError:
         pass
-    return freed
+    _flush_batch(pool, batch, futures)
+    return freed + _sum_results(futures)
+
+# Optional RE2 (google-re2) matches a pattern alternation as one DFA pass
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-def delete_globs(folder: Path, patterns) -> int:
+def _compile_globs(pats):
+    # All patterns as one anchored alternation, so each name is one match call
+    regexes = [fnmatch.translate(p) for p in pats]
+    if re2 is not None:
+        # RE2 spells the end-of-text anchor \z rather than \Z
+        src = "|".join(f"(?:{r[:-2]}\\z)" if r.endswith("\\Z") else f"(?:{r})" for r in regexes)
+        try:
+            return re2.compile(src)
+        except Exception:
+            pass    # construct RE2 doesn't support; use re
+    return re.compile("|".join(f"(?:{r})" for r in regexes))
+
+@functools.lru_cache(maxsize=32)
+def glob_matcher(patterns: tuple):
+    # Build one name predicate for a set of fnmatch patterns, case-folded
+    # like fnmatch.fnmatch. Globs of the form "prefix*suffix" sharing one
+    # suffix become plain string checks; anything else is a single regex.
+    pats = [os.path.normcase(p) for p in patterns]
+    simple = [p.split("*") for p in pats
+              if p.count("*") == 1 and not any(c in p for c in "?[")]
+    if pats and len(simple) == len(pats) and len({suf for _, suf in simple}) == 1:
+        prefixes = tuple(pre for pre, _ in simple)
+        suffix = simple[0][1]
+        cut = len(suffix)
+
+        def match(name):
+            name = os.path.normcase(name)
+            # Checking the prefix on what is left after the suffix keeps
+            # prefix and suffix from overlapping, as the glob requires
+            return name.endswith(suffix) and name[:len(name) - cut].startswith(prefixes)
+        return match
+    combined = _compile_globs(pats)
+    return lambda name: combined.match(os.path.normcase(name)) is not None
+
+def delete_globs(folder, patterns) -> int:
     freed = 0
-    if not folder.exists() or not folder.is_dir():
-        return 0
+    match = glob_matcher(tuple(patterns))
     try:
         with os.scandir(folder) as it:
             for entry in it:
-                if entry.is_file():
-                    name = entry.name
-                    if any(fnmatch.fnmatch(name, pat) for pat in patterns):
-                        freed += safe_remove_file(Path(entry.path))
-    except Exception:
+                if entry.is_file(follow_symlinks=False) and match(entry.name):
+                    freed += _safe_remove_entry(entry)
+    except OSError:
         pass
-    return freed
+    return _publish_freed(freed)
 
-# ---------------- Recycle Bin via Shell API ----------------
+# ---------------- Batch delete via IFileOperation ----------------
+ole32 = ctypes.windll.ole32
 shell32 = ctypes.windll.shell32
 
+CoInitializeEx = ole32.CoInitializeEx
+CoInitializeEx.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+CoInitializeEx.restype = ctypes.HRESULT
+
+CoUninitialize = ole32.CoUninitialize
+CoUninitialize.argtypes = []
+CoUninitialize.restype = None
+
+COINIT_APARTMENTTHREADED = 0x2
+CLSCTX_INPROC_SERVER = 0x1
+
+@contextmanager
+def com_apartment():
+    try:
+        CoInitializeEx(None, COINIT_APARTMENTTHREADED)
+        inited = True
+    except OSError:
+        # Already initialized with another model; COM calls still work
+        inited = False
+    try:
+        yield
+    finally:
+        if inited:
+            CoUninitialize()
+
+_com_thread = threading.local()
+
+def _ensure_com_apartment():
+    # Deletion pool threads live as long as the app, so each enters an
+    # apartment on its first shell batch and stays in it.
+    if not getattr(_com_thread, "ready", False):
+        try:
+            CoInitializeEx(None, COINIT_APARTMENTTHREADED)
+        except OSError:
+            pass    # already initialized with another model; COM calls still work
+        _com_thread.ready = True
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", wintypes.BYTE * 8),
+    ]
+
+def _guid(s: str) -> GUID:
+    return GUID.from_buffer_copy(uuid.UUID(s).bytes_le)
+
+CLSID_FileOperation = _guid("3ad05575-8857-4850-9277-11b85bdb8e09")
+IID_IFileOperation = _guid("947aab5f-0a5c-4c13-b4d6-4bf7836fc9f8")
+IID_IShellItem = _guid("43826d1e-e718-42ee-bc55-a1e261c37bfe")
+
+CoCreateInstance = ole32.CoCreateInstance
+CoCreateInstance.argtypes = [ctypes.POINTER(GUID), ctypes.c_void_p, wintypes.DWORD,
+                             ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)]
+CoCreateInstance.restype = ctypes.HRESULT
+
+SHCreateItemFromParsingName = shell32.SHCreateItemFromParsingName
+SHCreateItemFromParsingName.argtypes = [wintypes.LPCWSTR, ctypes.c_void_p,
+                                        ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)]
+SHCreateItemFromParsingName.restype = ctypes.HRESULT
+
+# vtable slots (IUnknown first)
+_RELEASE = 2
+_FO_SET_OPERATION_FLAGS = 5
+_FO_DELETE_ITEM = 18
+_FO_PERFORM_OPERATIONS = 21
+_FO_GET_ANY_OPERATIONS_ABORTED = 22
+
+FOF_SILENT = 0x0004
+FOF_NOCONFIRMATION = 0x0010
+FOF_NOCONFIRMMKDIR = 0x0200
+FOF_NOERRORUI = 0x0400
+FOF_NO_UI = FOF_SILENT | FOF_NOCONFIRMATION | FOF_NOERRORUI | FOF_NOCONFIRMMKDIR
+FOFX_NOCOPYHOOKS = 0x00800000
+
+BULK_DELETE_CHUNK = 512
+
+def _com_call(obj, slot, restype, argtypes, *args):
+    vtbl = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    fn = ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)(vtbl[slot])
+    return fn(obj, *args)
+
+def _com_release(obj):
+    if obj:
+        _com_call(obj, _RELEASE, wintypes.ULONG, [])
+
+def _shell_delete(paths) -> bool:
+    # Queue every path on one IFileOperation and run it. No FOF_ALLOWUNDO,
+    # so this is a permanent delete, and no FOFX_EARLYFAILURE: a locked cache
+    # file must not abort the rest of the batch. True only if all went through.
+    op = ctypes.c_void_p()
+    _ensure_com_apartment()
+    try:
+        CoCreateInstance(ctypes.byref(CLSID_FileOperation), None, CLSCTX_INPROC_SERVER,
+                         ctypes.byref(IID_IFileOperation), ctypes.byref(op))
+        _com_call(op, _FO_SET_OPERATION_FLAGS, ctypes.HRESULT, [wintypes.DWORD],
+                  FOF_NO_UI | FOFX_NOCOPYHOOKS)
+        queued_all = True
+        for p in paths:
+            item = ctypes.c_void_p()
+            try:
+                SHCreateItemFromParsingName(p, None, ctypes.byref(IID_IShellItem), ctypes.byref(item))
+                _com_call(op, _FO_DELETE_ITEM, ctypes.HRESULT,
+                          [ctypes.c_void_p, ctypes.c_void_p], item, None)
+            except OSError:
+                queued_all = False
+            finally:
+                _com_release(item)
+        _com_call(op, _FO_PERFORM_OPERATIONS, ctypes.HRESULT, [])
+        aborted = wintypes.BOOL()
+        _com_call(op, _FO_GET_ANY_OPERATIONS_ABORTED, ctypes.HRESULT,
+                  [ctypes.POINTER(wintypes.BOOL)], ctypes.byref(aborted))
+        return queued_all and not aborted.value
+    except OSError:
+        return False
+    finally:
+        _com_release(op)
+
+def _bulk_delete(entries) -> int:
+    return _publish_freed(_delete_batch(entries))
+
+def _delete_batch(entries) -> int:
+    # Delete a batch of file entries in one native call or shell operation.
+    # Sizes come from the entries up front; whatever a shell batch left
+    # behind goes per-file.
+    batch = []
+    for e in entries:
+        try:
+            st = e.stat(follow_symlinks=False)
+            if not st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                batch.append((e, int(st.st_size), st.st_file_attributes))
+        except OSError:
+            pass
+    if not batch:
+        return 0
+    if delete_batch_c is not None:
+        return int(delete_batch_c([(e.path, size, attrs) for e, size, attrs in batch]))
+    if _shell_delete([e.path for e, _, _ in batch]):
+        return sum(size for _, size, _ in batch)
+    freed = 0
+    for e, size, _ in batch:
+        if not os.path.lexists(e.path):
+            freed += size
+        else:
+            freed += _safe_remove_entry(e)
+    return freed
+
+# ---------------- Per-device deletion pools ----------------
+# Parallel deletes help SSDs but make a spinning disk seek back and forth,
+# so each physical disk gets its own pool sized for its kind.
+SSD_WORKERS = 8
+HDD_WORKERS = 2
+
+FILE_SHARE_READ = 0x1
+FILE_SHARE_WRITE = 0x2
+OPEN_EXISTING = 3
+IOCTL_STORAGE_GET_DEVICE_NUMBER = 0x002D1080
+IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+StorageDeviceSeekPenaltyProperty = 7
+PropertyStandardQuery = 0
+
+class STORAGE_DEVICE_NUMBER(ctypes.Structure):
+    _fields_ = [
+        ("DeviceType", wintypes.DWORD),
+        ("DeviceNumber", wintypes.DWORD),
+        ("PartitionNumber", wintypes.DWORD),
+    ]
+
+class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+    _fields_ = [
+        ("PropertyId", wintypes.DWORD),
+        ("QueryType", wintypes.DWORD),
+        ("AdditionalParameters", wintypes.BYTE * 1),
+    ]
+
+class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+    _fields_ = [
+        ("Version", wintypes.DWORD),
+        ("Size", wintypes.DWORD),
+        ("IncursSeekPenalty", wintypes.BOOLEAN),
+    ]
+
+GetVolumePathNameW = kernel32.GetVolumePathNameW
+GetVolumePathNameW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+GetVolumePathNameW.restype = wintypes.BOOL
+
+GetVolumeNameForVolumeMountPointW = kernel32.GetVolumeNameForVolumeMountPointW
+GetVolumeNameForVolumeMountPointW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+GetVolumeNameForVolumeMountPointW.restype = wintypes.BOOL
+
+CreateFileW = kernel32.CreateFileW
+CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+                        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+CreateFileW.restype = wintypes.HANDLE
+
+DeviceIoControl = kernel32.DeviceIoControl
+DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+                            ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                            ctypes.c_void_p]
+DeviceIoControl.restype = wintypes.BOOL
+
+CloseHandle = kernel32.CloseHandle
+CloseHandle.argtypes = [wintypes.HANDLE]
+CloseHandle.restype = wintypes.BOOL
+
+def _volume_of(path):
+    buf = ctypes.create_unicode_buffer(1024)
+    if not GetVolumePathNameW(path, buf, len(buf)):
+        return None
+    return buf.value
+
+def _device_info(volume):
+    # (physical disk key, incurs seek penalty) for a volume mount path, or None
+    name = ctypes.create_unicode_buffer(64)
+    if GetVolumeNameForVolumeMountPointW(volume, name, len(name)):
+        dev = name.value.rstrip("\\")     # \\?\Volume{guid}
+    else:
+        dev = "\\\\.\\" + volume.rstrip("\\")    # \\.\C:
+    h = CreateFileW(dev, 0, FILE_SHARE_READ | FILE_SHARE_WRITE, None, OPEN_EXISTING, 0, None)
+    if h == INVALID_HANDLE_VALUE:
+        return None
+    try:
+        ret = wintypes.DWORD()
+        num = STORAGE_DEVICE_NUMBER()
+        if DeviceIoControl(h, IOCTL_STORAGE_GET_DEVICE_NUMBER, None, 0,
+                           ctypes.byref(num), ctypes.sizeof(num), ctypes.byref(ret), None):
+            key = (num.DeviceType, num.DeviceNumber)
+        else:
+            key = dev   # e.g. a volume spanning disks; treat it as its own device
+        query = STORAGE_PROPERTY_QUERY(StorageDeviceSeekPenaltyProperty, PropertyStandardQuery)
+        seek = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+        incurs_seek = False
+        if DeviceIoControl(h, IOCTL_STORAGE_QUERY_PROPERTY, ctypes.byref(query), ctypes.sizeof(query),
+                           ctypes.byref(seek), ctypes.sizeof(seek), ctypes.byref(ret), None):
+            incurs_seek = bool(seek.IncursSeekPenalty)
+        return key, incurs_seek
+    finally:
+        CloseHandle(h)
+
+_pools_lock = threading.Lock()
+_device_pools = {}      # physical disk key -> pool
+_volume_pools = {}      # volume mount path -> pool
+# pool -> slots for Python tree walks on that disk, as many as it has workers.
+# Native walks run on the pool itself, so the pool is their limit.
+_walk_slots = {_DEL_POOL: threading.BoundedSemaphore(SSD_WORKERS)}
+
+def _pool_for(path):
+    # Deletion pool for the physical disk holding path; resolved once per volume.
+    vol = _volume_of(os.fspath(path))
+    if vol is None:
+        return _DEL_POOL
+    with _pools_lock:
+        pool = _volume_pools.get(vol)
+        if pool is None:
+            info = _device_info(vol)
+            if info is None:
+                pool = _DEL_POOL
+            else:
+                key, incurs_seek = info
+                pool = _device_pools.get(key)
+                if pool is None:
+                    workers = HDD_WORKERS if incurs_seek else SSD_WORKERS
+                    pool = ThreadPoolExecutor(max_workers=workers)
+                    _device_pools[key] = pool
+                    _walk_slots[pool] = threading.BoundedSemaphore(workers)
+            _volume_pools[vol] = pool
+    return pool
+
+# ---------------- Recycle Bin via Shell API ----------------
 class SHQUERYRBINFO(ctypes.Structure):
     _fields_ = [
         ("cbSize", wintypes.DWORD),
@@ -126,21 +559,48 @@ SHERB_NOCONFIRMATION = 0x00000001
 SHERB_NOPROGRESSUI = 0x00000002
 SHERB_NOSOUND = 0x00000004
 
-def empty_recycle_bin() -> int:
+GetLogicalDriveStringsW = kernel32.GetLogicalDriveStringsW
+GetLogicalDriveStringsW.argtypes = [wintypes.DWORD, wintypes.LPWSTR]
+GetLogicalDriveStringsW.restype = wintypes.DWORD
+
+GetDriveTypeW = kernel32.GetDriveTypeW
+GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+GetDriveTypeW.restype = wintypes.UINT
+
+DRIVE_FIXED = 3
+
+def fixed_drives():
+    # Root paths ("C:\\") of all fixed drives; each has its own $Recycle.Bin
+    buf = ctypes.create_unicode_buffer(1024)
+    n = GetLogicalDriveStringsW(len(buf), buf)
+    if not n or n > len(buf):
+        return []
+    return [d for d in buf[:n].split("\0") if d and GetDriveTypeW(d) == DRIVE_FIXED]
+
+def _query_recycle_bin(drive) -> int:
     info = SHQUERYRBINFO()
     info.cbSize = ctypes.sizeof(SHQUERYRBINFO)
-    before = 0
     try:
-        res = SHQueryRecycleBinW(None, ctypes.byref(info))
-        if res == 0:
-            before = int(info.i64Size)
-    except Exception:
-        pass
-    try:
-        SHEmptyRecycleBinW(None, None, SHERB_NOCONFIRMATION | SHERB_NOPROGRESSUI | SHERB_NOSOUND)
-    except Exception:
-        pass
-    return max(0, before)
+        SHQueryRecycleBinW(drive, ctypes.byref(info))
+    except OSError:
+        return 0
+    return max(0, int(info.i64Size))
+
+def _empty_drive_recycle_bin(drive) -> int:
+    # Runs on its own worker thread; give it its own COM apartment.
+    with com_apartment():
+        before = _query_recycle_bin(drive)
+        try:
+            SHEmptyRecycleBinW(None, drive, SHERB_NOCONFIRMATION | SHERB_NOPROGRESSUI | SHERB_NOSOUND)
+        except OSError:
+            pass
+        return _publish_freed(before)
+
+def empty_recycle_bin() -> int:
+    # Each drive is queried and emptied on its own thread; None means all drives.
+    drives = fixed_drives() or [None]
+    with ThreadPoolExecutor(max_workers=len(drives)) as ex:
+        return sum(ex.map(_empty_drive_recycle_bin, drives))
 
 # ---------------------- Cleaner Tasks ----------------------
 def get_env(name, default=""):
@@ -150,108 +610,147 @@ LOCALAPPDATA = ensure_path(get_env("LOCALAPPDATA", ""))
 APPDATA = ensure_path(get_env("APPDATA", ""))
 WINDIR = ensure_path(get_env("WINDIR", r"C:\Windows"))
 
+# Task roots as plain strings, joined once at import; hot paths stay on str
+RECENT_STR = str(APPDATA / "Microsoft" / "Windows" / "Recent")
+EXPLORER_CACHE_STR = str(LOCALAPPDATA / "Microsoft" / "Windows" / "Explorer")
+CHROME_ROOT_STR = str(LOCALAPPDATA / "Google" / "Chrome" / "User Data")
+EDGE_ROOT_STR = str(LOCALAPPDATA / "Microsoft" / "Edge" / "User Data")
+BRAVE_ROOT_STR = str(LOCALAPPDATA / "BraveSoftware" / "Brave-Browser" / "User Data")
+VIVALDI_ROOT_STR = str(LOCALAPPDATA / "Vivaldi" / "User Data")
+OPERA_ROOT_STR = str(LOCALAPPDATA / "Opera Software" / "Opera Stable")
+FIREFOX_PROFILES_STRS = (
+    str(LOCALAPPDATA / "Mozilla" / "Firefox" / "Profiles"),
+    str(APPDATA / "Mozilla" / "Firefox" / "Profiles"),
+)
+
 def clean_user_temp():
     return wipe_dir_contents(ensure_path(get_env("TEMP", "")))
 
 def clean_recent_items():
-    return wipe_dir_contents(APPDATA / "Microsoft" / "Windows" / "Recent")
+    return wipe_dir_contents(RECENT_STR)
+
+THUMBNAIL_GLOBS = ("thumbcache*.db", "iconcache*.db")
 
 def clean_thumbnails():
-    folder = LOCALAPPDATA / "Microsoft" / "Windows" / "Explorer"
-    return delete_globs(folder, ["thumbcache*.db", "iconcache*.db"])
+    return delete_globs(EXPLORER_CACHE_STR, THUMBNAIL_GLOBS)
 
 # Chromium-family caches
-def clean_chromium_user_data(root: Path) -> int:
-    freed = 0
-    if not root.exists():
-        return 0
-    candidates = [root]
+CHROMIUM_CACHE_DIRS = frozenset({
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "ShaderCache",
+    "DawnCache",
+    "Media Cache",
+    "Service Worker",   # only its CacheStorage subdir
+})
+
+def _scan_cache_dirs(base, profiles=None):
+    # Yield cache dirs found directly in base; collect other subdirs into
+    # profiles when given.
     try:
-        with os.scandir(root) as it:
+        with os.scandir(base) as it:
             for e in it:
-                if e.is_dir():
-                    candidates.append(Path(e.path))
-    except Exception:
+                try:
+                    if not e.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                if e.name in CHROMIUM_CACHE_DIRS:
+                    if e.name == "Service Worker":
+                        yield os.path.join(e.path, "CacheStorage")
+                    else:
+                        yield e.path
+                elif profiles is not None:
+                    profiles.append(e.path)
+    except OSError:
         pass
-    rels = [
-        "Cache",
-        "Code Cache",
-        "GPUCache",
-        "ShaderCache",
-        "DawnCache",
-        "Media Cache",
-        os.path.join("Service Worker", "CacheStorage"),
-    ]
-    for base in candidates:
-        for rel in rels:
-            freed += wipe_dir_contents(base / rel)
+
+def iter_chromium_cache_dirs(root, profiles=True):
+    # One enumeration of root and one per profile, instead of probing every
+    # cache name in every directory.
+    found = [] if profiles else None
+    yield from _scan_cache_dirs(root, found)
+    for profile in found or ():
+        yield from _scan_cache_dirs(profile)
+
+def clean_chromium_user_data(root, profiles=True) -> int:
+    # Every cache dir sits under root, so its disk is looked up once, and
+    # only if root turned up a cache dir at all
+    freed = 0
+    pool = None
+    for d in iter_chromium_cache_dirs(root, profiles):
+        pool = pool or _pool_for(root)
+        freed += wipe_dir_contents(d, pool)
     return freed
 
 def clean_chrome():
-    return clean_chromium_user_data(LOCALAPPDATA / "Google" / "Chrome" / "User Data")
+    return clean_chromium_user_data(CHROME_ROOT_STR)
 
 def clean_edge():
-    return clean_chromium_user_data(LOCALAPPDATA / "Microsoft" / "Edge" / "User Data")
+    return clean_chromium_user_data(EDGE_ROOT_STR)
 
 def clean_brave():
-    return clean_chromium_user_data(LOCALAPPDATA / "BraveSoftware" / "Brave-Browser" / "User Data")
+    return clean_chromium_user_data(BRAVE_ROOT_STR)
 
 def clean_vivaldi():
-    return clean_chromium_user_data(LOCALAPPDATA / "Vivaldi" / "User Data")
+    return clean_chromium_user_data(VIVALDI_ROOT_STR)
 
 def clean_opera():
-    root = LOCALAPPDATA / "Opera Software" / "Opera Stable"
-    freed = 0
-    if root.exists():
-        rels = [
-            "Cache", "Code Cache", "GPUCache", "ShaderCache",
-            "DawnCache", "Media Cache", os.path.join("Service Worker", "CacheStorage")
-        ]
-        for rel in rels:
-            freed += wipe_dir_contents(root / rel)
-    return freed
+    # Opera keeps a single profile directly in its root
+    return clean_chromium_user_data(OPERA_ROOT_STR, profiles=False)
 
 # Firefox caches
 def clean_firefox():
     freed = 0
-    for base in [
-        LOCALAPPDATA / "Mozilla" / "Firefox" / "Profiles",
-        APPDATA / "Mozilla" / "Firefox" / "Profiles",
-    ]:
-        if not base.exists():
-            continue
+    for base in FIREFOX_PROFILES_STRS:
         try:
             with os.scandir(base) as it:
+                pool = _pool_for(base)
                 for e in it:
                     if e.is_dir():
-                        p = Path(e.path)
-                        freed += wipe_dir_contents(p / "cache2")
-                        freed += wipe_dir_contents(p / "startupCache")
+                        freed += wipe_dir_contents(os.path.join(e.path, "cache2"), pool)
+                        freed += wipe_dir_contents(os.path.join(e.path, "startupCache"), pool)
         except Exception:
             pass
     return freed
 
 # For enabling/disabling checkboxes if browser data seems absent
-def path_has_content(path: Path) -> bool:
+FindFirstFileW = kernel32.FindFirstFileW
+FindFirstFileW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+FindFirstFileW.restype = wintypes.HANDLE
+
+FindNextFileW = kernel32.FindNextFileW
+FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+FindNextFileW.restype = wintypes.BOOL
+
+FindClose = kernel32.FindClose
+FindClose.argtypes = [wintypes.HANDLE]
+FindClose.restype = wintypes.BOOL
+
+def path_has_content(path) -> bool:
+    # One FindFirstFileW answers "missing or empty?" without a separate stat.
+    wfd = wintypes.WIN32_FIND_DATAW()
+    h = FindFirstFileW(os.path.join(path, "*"), ctypes.byref(wfd))
+    if h == INVALID_HANDLE_VALUE:
+        return False
     try:
-        if not path.exists():
-            return False
-        with os.scandir(path) as it:
-            for _ in it:
+        while True:
+            if wfd.cFileName not in (".", ".."):
                 return True
-    except Exception:
-        pass
-    return False
+            if not FindNextFileW(h, ctypes.byref(wfd)):
+                return False
+    finally:
+        FindClose(h)
 
 def browser_presence():
     return {
-        "Google Chrome": path_has_content(LOCALAPPDATA / "Google" / "Chrome" / "User Data"),
-        "Microsoft Edge": path_has_content(LOCALAPPDATA / "Microsoft" / "Edge" / "User Data"),
-        "Brave":          path_has_content(LOCALAPPDATA / "BraveSoftware" / "Brave-Browser" / "User Data"),
-        "Vivaldi":        path_has_content(LOCALAPPDATA / "Vivaldi" / "User Data"),
-        "Opera":          path_has_content(LOCALAPPDATA / "Opera Software" / "Opera Stable"),
-        "Firefox":        path_has_content(APPDATA / "Mozilla" / "Firefox" / "Profiles") or
-                          path_has_content(LOCALAPPDATA / "Mozilla" / "Firefox" / "Profiles"),
+        "Google Chrome": path_has_content(CHROME_ROOT_STR),
+        "Microsoft Edge": path_has_content(EDGE_ROOT_STR),
+        "Brave":          path_has_content(BRAVE_ROOT_STR),
+        "Vivaldi":        path_has_content(VIVALDI_ROOT_STR),
+        "Opera":          path_has_content(OPERA_ROOT_STR),
+        "Firefox":        any(path_has_content(p) for p in FIREFOX_PROFILES_STRS),
     }
 
 BASE_TASKS = [
@@ -271,48 +770,91 @@ BROWSER_TASKS = {
 }
 
 # ---------------------- Worker Thread ----------------------
-class CleanerThread(QThread):
-    stage = Signal(str, int, int)   # name, step_index, total_steps
+class CleanerSignals(QObject):
+    stage = Signal(str, int, int)   # name, tasks_completed, total_steps
     progress = Signal(int)          # total freed so far (bytes)
     done = Signal(int)              # total freed (bytes)
 
+class CleanerJob(QRunnable):
+    # Runs on QThreadPool.globalInstance(), which reuses its threads between cleans.
+    # Coalesce signals: emit only after this many new bytes or this long
+    EMIT_MIN_BYTES = 4 * 1024 * 1024
+    EMIT_MIN_INTERVAL = 0.1
+
     def __init__(self, tasks):
         super().__init__()
         self.tasks = tasks
+        self.signals = CleanerSignals()
 
     def run(self):
         total_freed = 0
         steps = len(self.tasks)
-        gc.collect()
-        for i, (name, func) in enumerate(self.tasks, start=1):
-            self.stage.emit(name, i, steps)
-            try:
-                freed = int(func() or 0)
-            except Exception:
-                freed = 0
-            total_freed += max(0, freed)
-            self.progress.emit(total_freed)
-        self.done.emit(total_freed)
+        if not steps:
+            self.signals.done.emit(0)
+            return
+        last_bytes = 0
+        last_time = time.monotonic()
+        # Tasks touch disjoint trees and are I/O-bound, so run them all at once
+        with ThreadPoolExecutor(max_workers=steps) as ex:
+            futures = {ex.submit(func): name for name, func in self.tasks}
+            for i, f in enumerate(as_completed(futures), start=1):
+                try:
+                    freed = int(f.result() or 0)
+                except Exception:
+                    freed = 0
+                total_freed += max(0, freed)
+                now = time.monotonic()
+                if (total_freed - last_bytes > self.EMIT_MIN_BYTES
+                        or now - last_time > self.EMIT_MIN_INTERVAL):
+                    self.signals.stage.emit(futures[f], i, steps)
+                    self.signals.progress.emit(total_freed)
+                    last_bytes = total_freed
+                    last_time = now
+        self.signals.done.emit(total_freed)
+
+class PresenceSignals(QObject):
+    ready = Signal(dict)            # browser name -> data found
+
+class PresenceProbe(QRunnable):
+    # Runs the browser_presence() disk probes on the global thread pool.
+    def __init__(self):
+        super().__init__()
+        self.signals = PresenceSignals()
+
+    def run(self):
+        try:
+            present = browser_presence()
+        except Exception:
+            present = {}
+        self.signals.ready.emit(present)
 
 # ---------------------- UI helpers ----------------------
 def emoji_icon(emoji: str, size: int = 128, bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)) -> QIcon:
+    # Same arguments always give the same icon, so render each one once
+    return _render_emoji_icon(emoji, size, bg.rgba(), fg.rgba())
+
+@functools.lru_cache(maxsize=16)
+def _render_emoji_icon(emoji: str, size: int, bg_rgba: int, fg_rgba: int) -> QIcon:
     pm = QPixmap(size, size)
     pm.fill(Qt.transparent)
     painter = QPainter(pm)
     painter.setRenderHint(QPainter.Antialiasing, True)
-    painter.setBrush(bg)
+    painter.setBrush(QColor.fromRgba(bg_rgba))
     painter.setPen(Qt.NoPen)
     painter.drawEllipse(0, 0, size, size)
     f = QFont()
     f.setPointSize(int(size * 0.55))
     painter.setFont(f)
-    painter.setPen(fg)
+    painter.setPen(QColor.fromRgba(fg_rgba))
     painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
     painter.end()
     return QIcon(pm)
 
 # ---------------------- Main Window ----------------------
 class QuickCleaner(QWidget):
+    PROGRESS_UI_INTERVAL_MS = 100   # cap "Freed" label repaints at ~10 Hz
+    LIVE_POLL_MS = 50               # how often the live freed counter is read
+
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -433,19 +975,39 @@ class QuickCleaner(QWidget):
         self.move_to_corner()
 
         self.cleaner = None
+        self.cleaning = False
         self.refresh_browser_presence()
 
+        # Throttle for on_progress; a pending value is flushed by the timer
+        self.pending_bytes = 0
+        self.progress_clock = QElapsedTimer()
+        self.progress_flush = QTimer(self)
+        self.progress_flush.setSingleShot(True)
+        self.progress_flush.timeout.connect(self.show_pending_progress)
+
+        # Live bytes come from the shared counter, read on a timer while cleaning
+        self.live_base = 0
+        self.live_timer = QTimer(self)
+        self.live_timer.timeout.connect(self.poll_live_freed)
+
     def refresh_browser_presence(self):
-        present = browser_presence()
+        # Probe off the UI thread; runs once, at startup
+        self.presence_probe = PresenceProbe()
+        self.presence_probe.signals.ready.connect(self.on_browser_presence)
+        QThreadPool.globalInstance().start(self.presence_probe)
+
+    def on_browser_presence(self, present):
+        busy = self.cleaning
         for name, cb in self.browser_checks.items():
             # Enable if likely present; still allow manual check even if not detected
-            cb.setEnabled(True)
+            cb.setEnabled(not busy)
             if not present.get(name, False):
                 cb.setToolTip("No data found; skipping may have no effect")
             else:
                 cb.setToolTip("")
-        # Update progress max based on default selection
-        self.update_progress_max()
+        # Update progress max based on default selection, unless a clean owns it
+        if not busy:
+            self.update_progress_max()
 
     def update_progress_max(self):
         selected_browsers = sum(1 for cb in self.browser_checks.values() if cb.isChecked())
@@ -470,7 +1032,7 @@ class QuickCleaner(QWidget):
         self.clean_btn.setEnabled(not busy)
         self.close_btn.setEnabled(not busy)
         for cb in self.browser_checks.values():
-            cb.setEnabled(not busy and cb.isEnabled())
+            cb.setEnabled(not busy)
 
     def build_task_list(self):
         tasks = list(BASE_TASKS)
@@ -480,7 +1042,7 @@ class QuickCleaner(QWidget):
         return tasks
 
     def start_clean(self):
-        if self.cleaner and self.cleaner.isRunning():
+        if self.cleaning:
             return
         tasks = self.build_task_list()
         self.progress.setRange(0, len(tasks))
@@ -488,33 +1050,55 @@ class QuickCleaner(QWidget):
         self.total_label.setText("Freed: 0 B")
         self.status_label.setText("Starting…")
         self.set_busy(True)
+        self.pending_bytes = 0
+        self.live_base = freed_so_far()
+        self.live_timer.start(self.LIVE_POLL_MS)
 
-        self.cleaner = CleanerThread(tasks)
-        self.cleaner.stage.connect(self.on_stage)
-        self.cleaner.progress.connect(self.on_progress)
-        self.cleaner.done.connect(self.on_done)
-        self.cleaner.start()
+        self.cleaning = True
+        self.cleaner = CleanerJob(tasks)
+        self.cleaner.signals.stage.connect(self.on_stage)
+        self.cleaner.signals.progress.connect(self.on_progress)
+        self.cleaner.signals.done.connect(self.on_done)
+        QThreadPool.globalInstance().start(self.cleaner)
 
-    def on_stage(self, name, step, total):
-        self.status_label.setText(f"Cleaning: {name}")
+    def on_stage(self, name, completed, total):
+        self.status_label.setText(f"Cleaned: {name}")
         self.progress.setMaximum(total)
-        self.progress.setValue(step - 1)
+        self.progress.setValue(completed)
+
+    def poll_live_freed(self):
+        self.on_progress(freed_so_far() - self.live_base)
 
     def on_progress(self, total_bytes):
-        self.total_label.setText(f"Freed: {human_size(total_bytes)}")
+        # Task totals and the live counter both land here; never go backwards
+        self.pending_bytes = max(self.pending_bytes, total_bytes)
+        if self.progress_clock.isValid():
+            elapsed = self.progress_clock.elapsed()
+            if elapsed < self.PROGRESS_UI_INTERVAL_MS:
+                if not self.progress_flush.isActive():
+                    self.progress_flush.start(self.PROGRESS_UI_INTERVAL_MS - elapsed)
+                return
+        self.show_pending_progress()
+
+    def show_pending_progress(self):
+        self.progress_clock.start()
+        self.total_label.setText(f"Freed: {human_size(self.pending_bytes)}")
 
     def on_done(self, total_bytes):
+        self.cleaning = False
+        self.live_timer.stop()
+        self.progress_flush.stop()
         self.progress.setValue(self.progress.maximum())
         self.status_label.setText("Done")
         self.total_label.setText(f"Freed: {human_size(total_bytes)}")
         self.set_busy(False)
-        self.refresh_browser_presence()
         self.update_progress_max()
 
 def main():
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     app.setLayoutDirection(Qt.LeftToRight)
+    # Rendered here, before the window exists; the tray gets the cached icon
     app.setWindowIcon(emoji_icon("🧹"))
 
     w = QuickCleaner()